@@ -1,36 +1,121 @@
+import hashlib
+import os
+from contextlib import asynccontextmanager
+
+import orjson
+import redis.asyncio as redis
+from jinja2 import FileSystemBytecodeCache
 from fastapi import FastAPI, Request
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 
 from service import ShotgridQuery
+from shotgrid_client import close_sg, get_sg
 
-app = FastAPI()
+# Query parameters for the /api/data endpoint
+ENTITY_TYPE = "Sequence"
+FILTERS = [["project", "is", {"type": "Project", "id": 85}]]
+FIELDS = ["code", "sg_cut_duration", "sg_ip_versions"]
 
-# Set up Jinja2 templates
-templates = Jinja2Templates(directory="templates")
+# How long cached /api/data responses stay fresh
+CACHE_TTL = 30  # seconds
 
 
-# Get data from Shotgrid
-def get_sg_query() -> list:
-    sg = ShotgridQuery()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create the shared Shotgrid client up front so the first request
+    # doesn't pay for connection-pool setup
+    get_sg()
+
+    app.state.redis = redis.from_url(
+        os.getenv("MS_REDIS_URL", "redis://localhost:6379/0")
+    )
+
+    yield
+
+    await close_sg()
+    await app.state.redis.aclose()
 
-    entity_type = "Sequence"
-    filters = [["project", "is", {"type": "Project", "id": 85}]]
-    fields = ["code", "sg_cut_duration", "sg_ip_versions"]
 
-    data = sg.get_data(entity_type, filters, fields)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
-    return data
+
+def get_cache_key(entity_type: str, filters: list, fields: list) -> str:
+    """Build a cache key for a Shotgrid query.
+
+    Args:
+        entity_type (str): The name of the entity type to get data for
+        filters (list): A list of filters to apply to the query
+        fields (list): A list of fields to return in the query
+
+    Returns:
+        str: A hex digest uniquely identifying the query
+    """
+    payload = orjson.dumps([entity_type, filters, fields], option=orjson.OPT_SORT_KEYS)
+
+    return hashlib.sha1(payload).hexdigest()
+
+
+# Set up Jinja2 templates, persisting compiled templates to disk so a
+# fresh worker loads them instead of re-parsing; template reload checks
+# only run in dev
+templates = Jinja2Templates(directory="templates")
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+templates.env.auto_reload = os.getenv("MS_ENV") == "dev"
 
 
 # Home page
 @app.get("/")
 async def index(request: Request):
-    # data = get_sg_query()
     return templates.TemplateResponse("index.html", {"request": request})
 
 
 @app.get("/api/data")
 async def get_data():
-    data = get_sg_query()
-    return JSONResponse(content=data)
+    key = get_cache_key(ENTITY_TYPE, FILTERS, FIELDS)
+
+    # Serve the cached payload if it is still fresh; a hit skips both the
+    # Shotgrid round-trips and re-serialization
+    cached = await app.state.redis.get(key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/x-ndjson")
+
+    sg = ShotgridQuery()
+    entities = sg.stream_data(ENTITY_TYPE, FILTERS, FIELDS)
+
+    # Resolve the first entity eagerly so upstream failures can still fall
+    # back to the last good payload before any bytes are sent
+    try:
+        first = await anext(entities, None)
+    except Exception:
+        stale = await app.state.redis.get(f"{key}:last")
+        if stale is not None:
+            return Response(
+                content=stale,
+                media_type="application/x-ndjson",
+                headers={"X-Cache": "STALE"},
+            )
+        raise
+
+    async def stream():
+        lines = []
+
+        if first is not None:
+            line = orjson.dumps(first) + b"\n"
+            lines.append(line)
+            yield line
+
+        async for entity in entities:
+            line = orjson.dumps(entity) + b"\n"
+            lines.append(line)
+            yield line
+
+        # Cache the complete payload once the stream has finished
+        payload = b"".join(lines)
+        await app.state.redis.setex(key, CACHE_TTL, payload)
+
+        # Keep an unexpiring copy of the last good payload for the
+        # fallback path
+        await app.state.redis.set(f"{key}:last", payload)
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
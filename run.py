@@ -10,6 +10,11 @@ load_dotenv()
 host = os.getenv("MS_HOST", "0.0.0.0")
 port = int(os.getenv("MS_PORT", 8000))
 
+# Auto-reload is a dev-only convenience; in production run one worker per
+# CPU (or MS_WORKERS) instead of the single reloading process
+reload = os.getenv("MS_ENV") == "dev"
+workers = int(os.getenv("MS_WORKERS", os.cpu_count() or 1))
+
 
 async def run_server():
     config = uvicorn.Config("main:app", host=host, port=port, reload=True)
@@ -27,4 +32,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if reload:
+        asyncio.run(main())
+    else:
+        # Production boxes are headless; webbrowser.open can hang there
+        # looking for a browser, so it only runs in dev
+        uvicorn.run("main:app", host=host, port=port, workers=workers)
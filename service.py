@@ -1,164 +1,496 @@
 """Service module for interacting with Shotgrid."""
 
-import os
-
-from shotgun_api3 import Shotgun
-from dotenv import load_dotenv
+import asyncio
+import time
+from dataclasses import dataclass
 from typing import Any
 
-# Load credentials from .env file
-load_dotenv()
+from shotgrid_client import AsyncShotgun, close_sg, get_sg
 
+# In-process TTL cache for field schemas, keyed by (entity type, field
+# name). Schemas change rarely, so repeated requests can skip the schema
+# round-trips.
+_SCHEMA_CACHE: dict[tuple[str, str], tuple[float, dict]] = {}
+_SCHEMA_CACHE_TTL = 300  # seconds
 
-class ShotgridQuery:
-    def __init__(
-        self, entity_type: str = "", filters: list = [], fields: list = []
-    ) -> None:
-        self.entity_type = entity_type
-        self.filters = filters
-        self.fields = fields
+# Fields known not to be query fields, keyed by entity type. Populated
+# opportunistically from the first schema fetch so requests touching only
+# plain fields can skip the schema round-trip entirely.
+_NON_QUERY_FIELDS: dict[str, set[str]] = {}
 
-    def create_shotgrid_connection(self) -> Shotgun:
-        """Create a connection to Shotgrid.
 
-        Returns:
-            Shotgun: An instance of the Shotgrid API
-        """
-        # Get Shotgrid credentials from environment variables
-        shotgrid_url = os.getenv("MS_SG_HOST")
-        shotgrid_script_name = os.getenv("MS_SG_SCRIPT_NAME")
-        shotgrid_script_key = os.getenv("MS_SG_SCRIPT_KEY")
+def clear_schema_cache() -> None:
+    """Clear the cached entity schemas (e.g. after a schema change)."""
+    _SCHEMA_CACHE.clear()
+    _NON_QUERY_FIELDS.clear()
 
-        # Create a shotgrid connection
-        sg = Shotgun(shotgrid_url, shotgrid_script_name, shotgrid_script_key)
 
-        return sg
+class ShotgridQuery:
+    def __init__(
+        self,
+        entity_type: str = "",
+        filters: list | None = None,
+        fields: list | None = None,
+    ) -> None:
+        self.entity_type = entity_type
+        self.filters = filters or []
+        self.fields = fields or []
 
-    def get_data(self, entity_type: str, filters: list = [], fields: list = []) -> dict:
+    async def get_data(
+        self, entity_type: str, filters: list | None = None, fields: list | None = None
+    ) -> dict:
         """Get entity data including query fields from Shotgrid.
 
         Args:
             entity_type (str): The name of the entity type to get data for
-            filters (list, optional): A list of filters to apply to the query. Defaults to [].
-            fields (list, optional): A list of fields to return in the query. Defaults to [].
+            filters (list, optional): A list of filters to apply to the query. Defaults to None.
+            fields (list, optional): A list of fields to return in the query. Defaults to None.
 
         Returns:
             dict: A dictionary of data from Shotgrid
         """
         self.entity_type = entity_type
-        self.filters = filters
-        self.fields = fields
+        self.filters = filters or []
+        self.fields = fields or []
 
-        sg = self.create_shotgrid_connection()
+        sg = get_sg()
 
-        # Get entities from SG
-        entities = self.__get_entities(sg, self.entity_type, self.filters, self.fields)
+        # The entity query and the schema lookup are independent, so run
+        # them concurrently
+        entities, specs = await asyncio.gather(
+            self.__get_entities(sg, self.entity_type, self.filters, self.fields),
+            self.__get_query_field_specs(sg),
+        )
 
         # Exit early if no entities are found
         if not entities:
             return []
 
-        # Get schema for entity type
-        schema = self.__get_schema(sg, self.entity_type)
+        # Populate query fields if they exist
+        if specs:
+            return await self.__populate_query_fields(sg, entities, specs)
 
-        # Filter out query fields that are not in self.fields
-        query_fields = {}
+        return entities
 
-        for field_name, field_metadata in schema.items():
-            if (
-                "query" in field_metadata.get("properties", {})
-                and field_name in self.fields
-            ):
-                query_fields[field_name] = schema[field_name]
+    async def stream_data(
+        self,
+        entity_type: str,
+        filters: list | None = None,
+        fields: list | None = None,
+        chunk_size: int = 25,
+    ):
+        """Stream entity data from Shotgrid as query fields resolve.
 
-        # Populate query fields if they exist
-        if query_fields:
-            updated_entities = []
+        Entities are split into chunks and each chunk's query fields are
+        populated concurrently; chunks are yielded as they complete, so the
+        first entities are available before the slowest Shotgrid call
+        finishes.
+
+        Args:
+            entity_type (str): The name of the entity type to get data for
+            filters (list, optional): A list of filters to apply to the query. Defaults to None.
+            fields (list, optional): A list of fields to return in the query. Defaults to None.
+            chunk_size (int, optional): The number of entities per chunk. Defaults to 25.
+
+        Yields:
+            dict: An entity with populated query fields
+        """
+        self.entity_type = entity_type
+        self.filters = filters or []
+        self.fields = fields or []
+
+        sg = get_sg()
+
+        # The entity query and the schema lookup are independent, so run
+        # them concurrently
+        entities, specs = await asyncio.gather(
+            self.__get_entities(sg, self.entity_type, self.filters, self.fields),
+            self.__get_query_field_specs(sg),
+        )
+
+        # Exit early if no entities are found
+        if not entities:
+            return
 
+        # Yield entities as-is if there are no query fields to populate
+        if not specs:
             for entity in entities:
-                updated_entity = self.__populate_query_fields(sg, entity, query_fields)
-                updated_entities.append(updated_entity)
+                yield entity
+            return
+
+        # Populate each chunk concurrently, yielding chunks as they finish
+        chunks = [
+            entities[start : start + chunk_size]
+            for start in range(0, len(entities), chunk_size)
+        ]
+        tasks = [
+            asyncio.create_task(self.__populate_query_fields(sg, chunk, specs))
+            for chunk in chunks
+        ]
+
+        try:
+            for task in asyncio.as_completed(tasks):
+                for entity in await task:
+                    yield entity
+        finally:
+            # Stop outstanding chunk work when the stream is abandoned early
+            # (a failed chunk or a closed generator), and retrieve any other
+            # chunk's exception so it isn't logged as never retrieved
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
+
+    async def __get_query_field_specs(self, sg: AsyncShotgun) -> list:
+        """Resolve the requested fields to compiled query field specs.
 
-            return updated_entities
+        Args:
+            sg (AsyncShotgun): An instance of the Shotgrid API
 
-        sg.close()
-        return entities
+        Returns:
+            list: A list of QueryFieldSpec objects, empty if no requested
+                field is a query field
+        """
+        # Constant-time membership checks; schemas can hold hundreds of fields
+        requested_fields = frozenset(self.fields)
 
-    def __get_entities(
-        self, sg: Shotgun, entity_type: str, filters: list = [], fields: list = []
+        # Exit early if every requested field is known not to be a query field
+        known_non_query = _NON_QUERY_FIELDS.get(self.entity_type)
+        if known_non_query and requested_fields.issubset(known_non_query):
+            return []
+
+        # Get the schema for the requested fields
+        schema = await self.__get_schema(sg, self.entity_type, self.fields)
+
+        # Split out the query fields, recording non-query fields so later
+        # requests can skip the schema fetch
+        query_fields = {}
+        non_query_fields = set()
+
+        for field_name, field_metadata in schema.items():
+            if "query" in field_metadata.get("properties", {}):
+                query_fields[field_name] = field_metadata
+            else:
+                non_query_fields.add(field_name)
+
+        _NON_QUERY_FIELDS.setdefault(self.entity_type, set()).update(non_query_fields)
+
+        # Parse each field's metadata once instead of per entity
+        return [
+            QueryFieldSpec.from_metadata(field_name, field_metadata)
+            for field_name, field_metadata in query_fields.items()
+        ]
+
+    async def __get_entities(
+        self,
+        sg: AsyncShotgun,
+        entity_type: str,
+        filters: list | None = None,
+        fields: list | None = None,
     ) -> list:
         """Get all entities for a project.
 
         Args:
-            sg (Shotgun): An instance of the Shotgrid API
+            sg (AsyncShotgun): An instance of the Shotgrid API
             entity_type (str): The name of the entity type to get entities for
-            filters (list, optional): A list of filters to apply to the query. Defaults to [].
-            fields (list, optional): A list of fields to return in the query. Defaults to [].
+            filters (list, optional): A list of filters to apply to the query. Defaults to None.
+            fields (list, optional): A list of fields to return in the query. Defaults to None.
 
         Returns:
             list: A list of entities for the project
         """
-        entities = sg.find(entity_type=entity_type, filters=filters, fields=fields)
+        entities = await sg.find(
+            entity_type=entity_type, filters=filters or [], fields=fields or []
+        )
 
         return entities
 
-    def __get_schema(self, sg: Shotgun, entity_type: str) -> dict:
-        """Get the schema for an entity type.
+    async def __get_schema(
+        self, sg: AsyncShotgun, entity_type: str, fields: list
+    ) -> dict:
+        """Get the schema for specific fields of an entity type.
+
+        Only the requested fields are fetched (concurrently, one small
+        response per field) instead of the entity type's full schema, and
+        each field's metadata is cached with a TTL.
 
         Args:
-            sg (Shotgun): An instance of the Shotgrid API
+            sg (AsyncShotgun): An instance of the Shotgrid API
             entity_type (str): The name of the entity type to get the schema for
+            fields (list): The fields to get schema metadata for
 
         Returns:
-            dict: The schema for the entity type
+            dict: The schema for the requested fields, keyed by field name
         """
-        # Get the schema for the entity type
-        schema = sg.schema_field_read(entity_type)
+        now = time.monotonic()
+        schema = {}
+        missing = []
+
+        # Serve fields from the cache while they are still fresh
+        for field_name in fields:
+            cached = _SCHEMA_CACHE.get((entity_type, field_name))
+            if cached and now - cached[0] < _SCHEMA_CACHE_TTL:
+                schema[field_name] = cached[1]
+            else:
+                missing.append(field_name)
+
+        if not missing:
+            return schema
+
+        # Fetch the remaining fields concurrently
+        results = await asyncio.gather(
+            *[
+                sg.schema_field_read(entity_type, field_name=field_name)
+                for field_name in missing
+            ]
+        )
+
+        for field_name, result in zip(missing, results):
+            field_metadata = (result or {}).get(field_name)
+            if field_metadata is None:
+                continue
+
+            schema[field_name] = field_metadata
+            _SCHEMA_CACHE[(entity_type, field_name)] = (
+                time.monotonic(),
+                field_metadata,
+            )
 
         return schema
 
-    def __populate_query_fields(
-        self, sg: Shotgun, entity: dict, query_fields: dict
-    ) -> dict:
-        """Populate query fields for an entity.
+    async def __populate_query_fields(
+        self, sg: AsyncShotgun, entities: list, specs: list
+    ) -> list:
+        """Populate query fields for all entities concurrently.
+
+        Each query field is resolved for every entity in a single batched
+        Shotgrid call, and the per-field calls run concurrently. Total cost
+        is one round-trip per query field rather than one per
+        (entity, query field) pair.
 
         Args:
-            sg (Shotgun): An instance of the Shotgrid API
-            entity (dict): The entity to populate query fields for
-            query_fields (dict): A dictionary of query fields to populate
+            sg (AsyncShotgun): An instance of the Shotgrid API
+            entities (list): The entities to populate query fields for
+            specs (list): A list of QueryFieldSpec objects to populate
 
         Returns:
-            dict: The entity with populated query fields
+            list: The entities with populated query fields
         """
-        for field_name, field_metadata in query_fields.items():
-            query_field = QueryField(sg, field_name, field_metadata, entity)
-            query_field_data = query_field.get_query_data()
+        coroutines = [
+            QueryField(sg, spec).get_batch_query_data(entities) for spec in specs
+        ]
 
-            entity[field_name] = query_field_data
-        return entity
+        results = await asyncio.gather(*coroutines)
 
+        # Assign each field's per-parent values back onto the entities
+        for spec, values_by_id in zip(specs, results):
+            for entity in entities:
+                entity[spec.field_name] = values_by_id.get(entity.get("id"))
 
-class QueryField:
-    def __init__(
-        self, sg: Shotgun, field_name: str, field_metadata: dict, entity: dict = None
-    ):
-        self.sg = sg
-        self.field_name = field_name
-        self.field_metadata = field_metadata
-        self.parent_entity = self.__get_parent_entity(entity)
+        return entities
+
+
+_LOGICAL_OPERATOR_LOOKUP = {"and": "all", "or": "any"}
+
+
+def _logical_operator(operator: str) -> str:
+    """Map a query-field logical operator to its Shotgrid filter operator.
+
+    Args:
+        operator (str): The logical operator to lookup.
+
+    Returns:
+        str: The Shotgrid logical operator.
+    """
+    if operator in _LOGICAL_OPERATOR_LOOKUP:
+        return _LOGICAL_OPERATOR_LOOKUP[operator]
+    raise ValueError(f"Logical Operator {operator} not found in lookup.")
+
+
+def _is_parent_token(value: Any) -> bool:
+    """Check whether a condition value is the parent entity placeholder."""
+    return isinstance(value, dict) and value.get("valid") == "parent_entity_token"
 
-        self.properties = field_metadata.get("properties")
 
-        self.summary_default = self.properties.get("summary_default", {}).get("value")
-        self.summary_value = self.properties.get("summary_value", {}).get("value")
-        self.summary_field = self.properties.get("summary_field", {}).get("value")
+def _compile_conditions(conditions: dict) -> tuple[dict, tuple]:
+    """Compile query-field conditions into a reusable filter template.
 
-        self.query = self.properties.get("query", {}).get("value")
+    The condition tree is identical for every entity a query field is
+    resolved against; only the parent entity reference differs. The tree is
+    walked once (iteratively, with an explicit stack) into a Shotgrid filter
+    template, and each condition referencing the parent entity becomes a
+    placeholder slot that callers patch per entity.
 
-        self.filters = self.query.get("filters")
-        self.entity_type = self.query.get("entity_type")
+    Args:
+        conditions (dict): The query field's condition tree.
 
-    def get_query_data(self) -> Any:
+    Returns:
+        tuple: The filter template and a tuple of parent entity slots, each
+            as (group_path, filter_index, path, relation, values).
+    """
+    template = {
+        "filter_operator": _logical_operator(conditions.get("logical_operator")),
+        "filters": [],
+    }
+    slots = []
+    stack = [(conditions, template, ())]
+
+    while stack:
+        group, compiled, group_path = stack.pop()
+
+        for condition in group.get("conditions", []):
+            if "conditions" in condition.keys():
+                # Defer the conditions subgroup to a later stack pass
+                nested = {
+                    "filter_operator": _logical_operator(
+                        condition.get("logical_operator")
+                    ),
+                    "filters": [],
+                }
+                stack.append(
+                    (condition, nested, group_path + (len(compiled["filters"]),))
+                )
+                compiled["filters"].append(nested)
+                continue
+
+            # Process condition
+            active = condition.get("active", True)
+            path = condition.get("path")
+            relation = condition.get("relation")
+            values = condition.get("values", [])
+
+            if not active:
+                continue
+
+            if any(_is_parent_token(value) for value in values):
+                # Record a placeholder slot to patch per entity
+                slots.append(
+                    (group_path, len(compiled["filters"]), path, relation, values)
+                )
+                compiled["filters"].append([path, relation, None])
+                continue
+
+            # Use single value if only one value is present
+            value = values
+            if len(values) == 1:
+                value = values[0]
+
+            compiled["filters"].append([path, relation, value])
+
+    return template, tuple(slots)
+
+
+def _patch_slots(template: dict, slots: tuple, make_filter) -> dict:
+    """Copy a filter template and fill in its parent entity slots.
+
+    Only the nodes on the path to each slot are copied, so the static parts
+    of the template stay shared between entities.
+
+    Args:
+        template (dict): The filter template to patch.
+        slots (tuple): The parent entity slots recorded at compile time.
+        make_filter (callable): Builds the filter entry for one slot from
+            its (path, relation, values).
+
+    Returns:
+        dict: A patched copy of the template.
+    """
+    root = {
+        "filter_operator": template["filter_operator"],
+        "filters": list(template["filters"]),
+    }
+
+    for group_path, filter_index, path, relation, values in slots:
+        group = root
+        for index in group_path:
+            nested = group["filters"][index]
+            nested = {
+                "filter_operator": nested["filter_operator"],
+                "filters": list(nested["filters"]),
+            }
+            group["filters"][index] = nested
+            group = nested
+
+        group["filters"][filter_index] = make_filter(path, relation, values)
+
+    return root
+
+
+@dataclass(frozen=True, slots=True)
+class QueryFieldSpec:
+    """Precomputed metadata for a single query field.
+
+    Extracting the nested metadata lookups and compiling the filter
+    conditions once per field avoids repeating both for every entity the
+    field is resolved against.
+    """
+
+    field_name: str
+    entity_type: str
+    summary_default: str
+    summary_value: Any
+    summary_field: str
+    filter_template: dict
+    parent_slots: tuple
+
+    @classmethod
+    def from_metadata(cls, field_name: str, field_metadata: dict) -> "QueryFieldSpec":
+        """Build a spec from a field's schema metadata.
+
+        Args:
+            field_name (str): The name of the query field
+            field_metadata (dict): The field's schema metadata
+
+        Returns:
+            QueryFieldSpec: The compiled spec for the field
+        """
+        properties = field_metadata.get("properties")
+        query = properties.get("query", {}).get("value")
+
+        filter_template, parent_slots = _compile_conditions(query.get("filters"))
+
+        return cls(
+            field_name=field_name,
+            entity_type=query.get("entity_type"),
+            summary_default=properties.get("summary_default", {}).get("value"),
+            summary_value=properties.get("summary_value", {}).get("value"),
+            summary_field=properties.get("summary_field", {}).get("value"),
+            filter_template=filter_template,
+            parent_slots=parent_slots,
+        )
+
+
+class QueryField:
+    __slots__ = (
+        "sg",
+        "field_name",
+        "entity_type",
+        "summary_default",
+        "summary_value",
+        "summary_field",
+        "filter_template",
+        "parent_slots",
+        "parent_entity",
+        "parent_path",
+    )
+
+    def __init__(self, sg: AsyncShotgun, spec: QueryFieldSpec, entity: dict = None):
+        self.sg = sg
+        self.field_name = spec.field_name
+        self.entity_type = spec.entity_type
+        self.summary_default = spec.summary_default
+        self.summary_value = spec.summary_value
+        self.summary_field = spec.summary_field
+        self.filter_template = spec.filter_template
+        self.parent_slots = spec.parent_slots
+
+        self.parent_entity = self.__get_parent_entity(entity)
+
+        # Set while patching filter slots in batch mode
+        self.parent_path = None
+
+    async def get_query_data(self) -> Any:
         """Retrieve query data based on the summary default value.
 
         Depending on the value of `self.summary_default`, this method will:
@@ -180,26 +512,202 @@ class QueryField:
             "minimum",
             "sum",
         ]:
-            return self.query_calculation(calculation_type=self.summary_default)
+            return await self.query_calculation(calculation_type=self.summary_default)
         elif self.summary_default == "record_count":
-            return self.query_record_count()
+            return await self.query_record_count()
         elif self.summary_default == "single_record":
-            return self.query_single_record()
+            return await self.query_single_record()
         else:
             raise ValueError(f"Summary Default {self.summary_default} not supported.")
 
+    async def get_batch_query_data(self, parent_entities: list) -> dict:
+        """Retrieve query data for all parent entities in one request.
+
+        The per-entity condition on the parent is widened to an "in" filter
+        over every parent at once, and the grouped results are mapped back
+        to their parent entity ids.
+
+        Args:
+            parent_entities (list): The entities to resolve this field for.
+
+        Returns:
+            dict: A mapping of parent entity id to the field value.
+
+        Raises:
+            ValueError: If the summary default value is not supported.
+        """
+        if self.summary_default in [
+            "average",
+            "count",
+            "maximum",
+            "minimum",
+            "sum",
+            "record_count",
+        ]:
+            return await self.batch_query_calculation(parent_entities)
+        elif self.summary_default == "single_record":
+            return await self.batch_query_single_record(parent_entities)
+        else:
+            raise ValueError(f"Summary Default {self.summary_default} not supported.")
+
+    async def batch_query_calculation(self, parent_entities: list) -> dict:
+        """Perform a query calculation for all parent entities in one request.
+
+        Args:
+            parent_entities (list): The entities to resolve this field for.
+
+        Returns:
+            dict: A mapping of parent entity id to the calculation result.
+        """
+        calculation_type = self.summary_default
+        if calculation_type == "record_count":
+            calculation_type = "count"
+
+        field = self.summary_field
+        summary_fields = [{"field": field, "type": calculation_type}]
+
+        # Fields whose conditions never reference the parent entity resolve
+        # to one shared value; run a single ungrouped query for those
+        if not self.parent_slots:
+            summary = await self.sg.summarize(
+                entity_type=self.entity_type,
+                filters=self.get_sg_filters(),
+                summary_fields=summary_fields,
+            )
+            value = summary["summaries"][field]
+
+            return {entity.get("id"): value for entity in parent_entities}
+
+        filters = self.get_batch_sg_filters(parent_entities)
+        grouping = [{"field": self.parent_path, "type": "exact", "direction": "asc"}]
+
+        summary = await self.sg.summarize(
+            entity_type=self.entity_type,
+            filters=filters,
+            summary_fields=summary_fields,
+            grouping=grouping,
+        )
+
+        # Counts and sums default to 0 for parents with no matching records
+        default = 0 if calculation_type in ["count", "sum"] else None
+        results = {entity.get("id"): default for entity in parent_entities}
+
+        for group in summary.get("groups", []):
+            group_value = group.get("group_value")
+            if isinstance(group_value, dict):
+                group_value = group_value.get("id")
+
+            results[group_value] = group["summaries"][field]
+
+        return results
+
+    async def batch_query_single_record(self, parent_entities: list) -> dict:
+        """Perform a single record query for all parent entities in one request.
+
+        Args:
+            parent_entities (list): The entities to resolve this field for.
+
+        Returns:
+            dict: A mapping of parent entity id to the query result.
+        """
+        # Fields whose conditions never reference the parent entity resolve
+        # to one shared value; run a single unbatched query for those
+        if not self.parent_slots:
+            value = await self.query_single_record()
+
+            return {entity.get("id"): value for entity in parent_entities}
+
+        filters = self.get_batch_sg_filters(parent_entities)
+        field = self.summary_field
+
+        sg_results = await self.sg.find(
+            entity_type=self.entity_type,
+            filters=filters,
+            fields=[field, self.parent_path],
+        )
+
+        # Bucket the result values by their parent entity
+        buckets = {entity.get("id"): [] for entity in parent_entities}
+
+        for entity in sg_results:
+            parent = entity.get(self.parent_path)
+            if isinstance(parent, dict):
+                parent = parent.get("id")
+
+            if parent not in buckets:
+                continue
+
+            if isinstance(entity.get(field), dict):
+                buckets[parent].append(entity[field].get("name"))
+            else:
+                buckets[parent].append(entity[field])
+
+        return {
+            parent_id: values[0] if values else None
+            for parent_id, values in buckets.items()
+        }
+
+    def get_batch_sg_filters(self, parent_entities: list) -> list:
+        """Build Shotgrid filters matching every parent entity at once.
+
+        Widens the compiled template's parent entity slots to "in" filters
+        over all parents and records the parent path for grouping. Widening
+        assumes the field has a single parent entity condition (the
+        Shotgrid default); with several, all are widened but results are
+        grouped by the first condition's path.
+
+        Args:
+            parent_entities (list): The entities to match against.
+
+        Returns:
+            list: A list of Shotgrid filters
+        """
+        batch_parents = [
+            {"type": entity.get("type"), "id": entity.get("id")}
+            for entity in parent_entities
+        ]
+
+        # Group by the first parent condition's path
+        if self.parent_slots:
+            self.parent_path = self.parent_slots[0][2]
+
+        def widen_to_batch(path, relation, values):
+            return [path, "in", batch_parents]
+
+        filters = _patch_slots(self.filter_template, self.parent_slots, widen_to_batch)
+
+        return [filters]
+
     def get_sg_filters(self) -> list:
-        """Convert query field conditions to Shotgrid filters.
+        """Build Shotgrid filters for this field's parent entity.
+
+        Patches the compiled template's parent entity slots with the parent
+        entity reference; the static parts of the template are reused as-is.
 
         Returns:
             list: A list of Shotgrid filters
         """
-        conditions = self.filters
-        filters = self.__convert_conditions_to_filter(conditions)
+        if not self.parent_slots:
+            return [self.filter_template]
+
+        def bind_parent(path, relation, values):
+            lookup_values = [
+                self.parent_entity if _is_parent_token(value) else value
+                for value in values
+            ]
+
+            # Use single value if only one value is present
+            value = lookup_values
+            if len(lookup_values) == 1:
+                value = lookup_values[0]
+
+            return [path, relation, value]
+
+        filters = _patch_slots(self.filter_template, self.parent_slots, bind_parent)
 
         return [filters]
 
-    def query_calculation(self, calculation_type: str) -> Any:
+    async def query_calculation(self, calculation_type: str) -> Any:
         """Perform a query calculation on the Shotgrid entity.
 
         Args:
@@ -217,13 +725,13 @@ class QueryField:
         field = self.summary_field
         summary_fields = [{"field": field, "type": calculation_type}]
 
-        summary = self.sg.summarize(
+        summary = await self.sg.summarize(
             entity_type=self.entity_type, filters=filters, summary_fields=summary_fields
         )
 
         return summary["summaries"][field]
 
-    def query_record_count(self) -> int:
+    async def query_record_count(self) -> int:
         """Perform a record count query on the Shotgrid entity.
 
         Returns:
@@ -233,36 +741,36 @@ class QueryField:
         field = self.summary_field
         summary_fields = [{"field": field, "type": "count"}]
 
-        summary = self.sg.summarize(
+        summary = await self.sg.summarize(
             entity_type=self.entity_type, filters=filters, summary_fields=summary_fields
         )
 
         return summary["summaries"][field]
 
-    def query_single_record(self) -> str:
+    async def query_single_record(self) -> str:
         """Perform a single record query on the Shotgrid entity.
 
+        Only one record is requested, since a single record field displays
+        exactly one value.
+
         Returns:
             str: The result of the query.
         """
         filters = self.get_sg_filters()
         field = self.summary_field
 
-        sg_results = self.sg.find(
-            entity_type=self.entity_type, filters=filters, fields=[field]
+        sg_results = await self.sg.find(
+            entity_type=self.entity_type, filters=filters, fields=[field], limit=1
         )
 
         if not sg_results:
             return None
 
-        results = []
-        for entity in sg_results:
-            if isinstance(entity.get(field), dict):
-                results.append(entity[field].get("name"))
-            else:
-                results.append(entity[field])
+        value = sg_results[0].get(field)
+        if isinstance(value, dict):
+            return value.get("name")
 
-        return ", ".join(results)
+        return value
 
     def logical_operator_lookup(self, operator: str) -> str:
         """Lookup table for logical operators.
@@ -273,62 +781,7 @@ class QueryField:
         Returns:
             str: The Shotgrid logical operator.
         """
-        operator_lookup = {"and": "all", "or": "any"}
-        if operator in operator_lookup.keys():
-            return operator_lookup[operator]
-        raise ValueError(f"Logical Operator {operator} not found in lookup.")
-
-    def __convert_conditions_to_filter(self, conditions: list) -> list:
-        """Convert conditions to Shotgrid filters.
-
-        Args:
-            conditions (list): A list of conditions to convert to filters.
-
-        Returns:
-            list: A list of Shotgrid filters.
-        """
-        sg_filters = []
-
-        logical_operator = self.logical_operator_lookup(
-            conditions.get("logical_operator")
-        )
-
-        for condition in conditions.get("conditions", []):
-            if "conditions" in condition.keys():
-                # Recursively convert conditions subgroup to filter
-                nested_filters = self.__convert_conditions_to_filter(condition)
-
-                # Append the nested filter group
-                sg_filters.append(nested_filters)
-            else:
-                # Process condition
-                active = condition.get("active", True)
-                path = condition.get("path")
-                relation = condition.get("relation")
-                values = condition.get("values", [])
-
-                if not active:
-                    continue
-
-                # Check if value needs to be replaced with parent_entity
-                lookup_values = []
-                for value in values:
-                    if (
-                        isinstance(value, dict)
-                        and value.get("valid") == "parent_entity_token"
-                    ):
-                        lookup_values.append(self.parent_entity)
-                    else:
-                        lookup_values.append(value)
-
-                # Use single value if only one value is present
-                value = lookup_values
-                if len(lookup_values) == 1:
-                    value = lookup_values[0]
-
-                sg_filters.append([path, relation, value])
-
-        return {"filter_operator": logical_operator, "filters": sg_filters}
+        return _logical_operator(operator)
 
     def __get_parent_entity(self, entity: dict) -> dict:
         """Get the parent entity from the entity dictionary.
@@ -339,6 +792,9 @@ class QueryField:
         Returns:
             dict: The parent entity dictionary.
         """
+        if entity is None:
+            return None
+
         keys = ["type", "id"]
         parent_entity = {}
 
@@ -353,6 +809,13 @@ if __name__ == "__main__":
     fields = ["code", "sg_cut_duration", "sg_ip_versions"]
 
     sg_query = ShotgridQuery()
-    sequences = sg_query.get_data(
-        entity_type="Sequence", filters=filters, fields=fields
-    )
+
+    async def run_query() -> list:
+        try:
+            return await sg_query.get_data(
+                entity_type="Sequence", filters=filters, fields=fields
+            )
+        finally:
+            await close_sg()
+
+    sequences = asyncio.run(run_query())
@@ -0,0 +1,276 @@
+"""Async Shotgrid client used in place of the blocking shotgun_api3."""
+
+import os
+
+import httpx
+from dotenv import load_dotenv
+
+# Load credentials from .env file
+load_dotenv()
+
+# Snapshot Shotgrid credentials at import so a misconfigured environment
+# shows up at startup rather than on the first request
+_SG_HOST = os.getenv("MS_SG_HOST")
+_SG_SCRIPT_NAME = os.getenv("MS_SG_SCRIPT_NAME")
+_SG_SCRIPT_KEY = os.getenv("MS_SG_SCRIPT_KEY")
+
+
+class ShotgridError(Exception):
+    """Raised when Shotgrid returns an error response."""
+
+
+def _translate_filters(filters: list | None, operator: str = "and") -> dict:
+    """Convert API-style filter lists to Shotgrid's condition format.
+
+    Args:
+        filters (list): A list of filters in the simple [path, relation,
+            value] form, or nested {"filter_operator": ..., "filters": ...}
+            groups.
+        operator (str, optional): The logical operator joining the filters.
+            Defaults to "and".
+
+    Returns:
+        dict: The filters in Shotgrid's condition format.
+    """
+    conditions = []
+
+    for sg_filter in filters or []:
+        if isinstance(sg_filter, dict):
+            # Nested filter group
+            nested_operator = (
+                "and" if sg_filter.get("filter_operator") == "all" else "or"
+            )
+            conditions.append(
+                _translate_filters(sg_filter.get("filters"), nested_operator)
+            )
+            continue
+
+        path, relation, *values = sg_filter
+
+        # A single list value holds the values directly (e.g. "in" filters)
+        if len(values) == 1 and isinstance(values[0], (list, tuple)):
+            values = list(values[0])
+
+        conditions.append({"path": path, "relation": relation, "values": values})
+
+    return {"logical_operator": operator, "conditions": conditions}
+
+
+class AsyncShotgun:
+    """Thin async client for Shotgrid's api3/json endpoint.
+
+    Implements the calls this app uses (find, summarize, schema_field_read)
+    over a shared httpx.AsyncClient, so Shotgrid round-trips no longer block
+    the event loop or need worker threads, and concurrent calls multiplex
+    over pooled connections.
+    """
+
+    ENTITIES_PER_PAGE = 500
+
+    def __init__(
+        self,
+        base_url: str,
+        script_name: str,
+        script_key: str,
+        max_connections: int = 64,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.script_name = script_name
+        self.script_key = script_key
+
+        self._client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections),
+            timeout=httpx.Timeout(60.0),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncShotgun":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def _call(self, method_name: str, params: dict | None = None) -> dict:
+        """Issue one api3/json call and return its results.
+
+        Args:
+            method_name (str): The Shotgrid API method to call.
+            params (dict, optional): The method parameters. Defaults to None.
+
+        Returns:
+            dict: The "results" section of the response.
+
+        Raises:
+            ShotgridError: If Shotgrid reports an exception.
+        """
+        auth = {"script_name": self.script_name, "script_key": self.script_key}
+
+        payload = {"method_name": method_name, "params": [auth]}
+        if params is not None:
+            payload["params"].append(params)
+
+        response = await self._client.post(
+            f"{self.base_url}/api3/json", json=payload
+        )
+        response.raise_for_status()
+
+        body = response.json()
+
+        if isinstance(body, dict) and body.get("exception"):
+            raise ShotgridError(body.get("message", "Unknown Shotgrid error"))
+
+        return body.get("results")
+
+    async def find(
+        self,
+        entity_type: str,
+        filters: list | None = None,
+        fields: list | None = None,
+        limit: int = 0,
+    ) -> list:
+        """Find entities matching the given filters.
+
+        Args:
+            entity_type (str): The name of the entity type to find.
+            filters (list, optional): A list of filters to apply to the query. Defaults to None.
+            fields (list, optional): A list of fields to return in the query. Defaults to None.
+            limit (int, optional): The maximum number of entities to return.
+                Defaults to 0 (no limit).
+
+        Returns:
+            list: The matching entities.
+        """
+        entities_per_page = self.ENTITIES_PER_PAGE
+        if limit:
+            entities_per_page = min(limit, entities_per_page)
+
+        params = {
+            "type": entity_type,
+            "return_fields": list(fields) if fields else ["id"],
+            "filters": _translate_filters(filters),
+            "return_only": "active",
+            "paging": {
+                "entities_per_page": entities_per_page,
+                "current_page": 1,
+            },
+        }
+
+        entities = []
+
+        while True:
+            results = await self._call("read", params)
+            page = results.get("entities", [])
+            entities.extend(page)
+
+            if limit and len(entities) >= limit:
+                return entities[:limit]
+
+            if len(page) < entities_per_page:
+                return entities
+
+            params["paging"]["current_page"] += 1
+
+    async def summarize(
+        self,
+        entity_type: str,
+        filters: list,
+        summary_fields: list,
+        grouping: list | None = None,
+    ) -> dict:
+        """Summarize entities matching the given filters.
+
+        Args:
+            entity_type (str): The name of the entity type to summarize.
+            filters (list): A list of filters to apply to the query.
+            summary_fields (list): The fields and calculation types to summarize.
+            grouping (list, optional): Grouping to apply to the summaries. Defaults to None.
+
+        Returns:
+            dict: The summaries, including per-group summaries when grouped.
+        """
+        params = {
+            "type": entity_type,
+            "summaries": summary_fields,
+            "filters": _translate_filters(filters),
+        }
+
+        if grouping is not None:
+            params["grouping"] = grouping
+
+        return await self._call("summarize", params)
+
+    async def schema_field_read(
+        self, entity_type: str, field_name: str | None = None
+    ) -> dict:
+        """Read the field schema for an entity type.
+
+        Args:
+            entity_type (str): The name of the entity type to read.
+            field_name (str, optional): A single field to read. Defaults to
+                None (all fields).
+
+        Returns:
+            dict: The schema keyed by field name.
+        """
+        params = {"type": entity_type}
+
+        if field_name is not None:
+            params["field_name"] = field_name
+
+        return await self._call("schema_field_read", params)
+
+
+# Shared Shotgrid client, created lazily on first use and reused across
+# requests so concurrent calls share one connection pool.
+_SG: AsyncShotgun | None = None
+
+
+def get_sg() -> AsyncShotgun:
+    """Get the shared Shotgrid client, creating it on first use.
+
+    Returns:
+        AsyncShotgun: The shared Shotgrid client.
+
+    Raises:
+        ValueError: If any Shotgrid credential is missing from the
+            environment.
+    """
+    global _SG
+
+    if _SG is None:
+        missing = [
+            name
+            for name, value in [
+                ("MS_SG_HOST", _SG_HOST),
+                ("MS_SG_SCRIPT_NAME", _SG_SCRIPT_NAME),
+                ("MS_SG_SCRIPT_KEY", _SG_SCRIPT_KEY),
+            ]
+            if not value
+        ]
+
+        if missing:
+            raise ValueError(
+                f"Missing Shotgrid credentials: {', '.join(missing)}. "
+                "Set them in the environment or .env file."
+            )
+
+        _SG = AsyncShotgun(_SG_HOST, _SG_SCRIPT_NAME, _SG_SCRIPT_KEY)
+
+    return _SG
+
+
+async def close_sg() -> None:
+    """Close the shared Shotgrid client, if one was created.
+
+    Called at app shutdown so pooled sockets are released deterministically
+    instead of lingering until garbage collection.
+    """
+    global _SG
+
+    if _SG is not None:
+        await _SG.aclose()
+        _SG = None